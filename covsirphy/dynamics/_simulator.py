@@ -1,5 +1,8 @@
 
 from datetime import timedelta
+from functools import partial
+from multiprocessing import Pool
+import numpy as np
 import pandas as pd
 from covsirphy.util.error import NAFoundError
 from covsirphy.util.validator import Validator
@@ -26,16 +29,18 @@ class _Simulator(Term):
 
     def __init__(self, model, data):
         self._model = Validator(model, "model", accept_none=False).subclass(ODEModel)
+        self._parameters = model._PARAMETERS[:]
         self._df = Validator(data, "data", accept_none=False).dataframe(
-            time_index=True, columns=[self._PH, *self._SIRF, *model._PARAMETERS])
+            time_index=True, columns=[self._PH, *self._SIRF, *self._parameters])
         self._first, self._last = data.index.min(), data.index.max()
 
-    def run(self, tau, model_specific=False):
+    def run(self, tau, model_specific=False, n_jobs=1):
         """Perform simulation with phase-dependent ODE model.
 
         Args:
             tau (int): tau value [min]
             model_specific (bool): whether convert S, I, F, R to model-specific variables or not
+            n_jobs (int): the number of parallel jobs
 
         Raises:
             NAFoundError: ODE parameter values on the start dates of phases are un-set
@@ -53,33 +58,84 @@ class _Simulator(Term):
                     Fatal (int): the number of fatal cases
                     if @model_specific is True, variables defined by model.VARIABLES of covsirphy.Dynamics(model)
         """
-        all_df = self._df.copy()
-        all_df[self._PH], _ = all_df[self._PH].factorize()
-        date_groupby = all_df.reset_index().groupby(self._PH)
-        start_dates = date_groupby.first()[self.DATE].sort_values()
-        end_dates = date_groupby.last()[self.DATE].sort_values()
-        variables, parameters = self._SIRF, self._model._PARAMETERS[:]
-        param_df = all_df.ffill().loc[:, parameters]
-        # Simulation
-        dataframes = []
-        for (start, end) in zip(start_dates, end_dates):
-            variable_df = all_df.loc[start: end + timedelta(days=1), variables]
-            if variable_df.iloc[0].isna().any():
-                variable_df = pd.DataFrame(
-                    index=pd.date_range(start, end + timedelta(days=1), freq="D"), columns=self._SIRF)
-                variable_df.update(self._model.inverse_transform(dataframes[-1]))
-            variable_df.index.name = self.DATE
-            if param_df.loc[start].isna().any():
+        all_df = self._df
+        # Positions of the start/end dates of phases (the index of phase_df is the positions)
+        phase_df = all_df.reset_index()
+        start_pos = phase_df.drop_duplicates(self._PH, keep="first").index.to_numpy()
+        end_pos = phase_df.drop_duplicates(self._PH, keep="last").index.to_numpy()
+        dates = all_df.index
+        variables, parameters = self._SIRF, self._parameters
+        variable_all_df = all_df.loc[:, variables]
+        variable_arr = variable_all_df.to_numpy(dtype=np.float64, na_value=np.nan)
+        param_arr = all_df.loc[:, parameters].ffill().to_numpy(dtype=np.float64, na_value=np.nan)
+        for pos in start_pos:
+            if np.isnan(param_arr[pos]).any():
                 raise NAFoundError(
-                    f"ODE parameter values on {start.strftime(self.DATE_FORMAT)}", value=param_df.loc[start].to_dict(),
+                    f"ODE parameter values on {dates[pos].strftime(self.DATE_FORMAT)}", value=dict(zip(parameters, param_arr[pos])),
                     details="Please set values with .register() or .estimate_params()")
-            param_dict = param_df.loc[start].to_dict()
-            instance = self._model.from_data(data=variable_df.reset_index(), param_dict=param_dict, tau=tau)
-            dataframes.append(instance.solve())
-        # Combine results of phases
-        df = pd.concat(dataframes, axis=0).groupby(level=0).first().loc[self._first: self._last]
+        # Combine sequential phases which have the same parameter values and no records on their start dates
+        seg_starts, seg_ends = [start_pos[0]], [end_pos[0]]
+        for (sp, ep) in zip(start_pos[1:], end_pos[1:]):
+            if np.isnan(variable_arr[sp]).any() and np.array_equal(param_arr[sp], param_arr[seg_starts[-1]]):
+                seg_ends[-1] = ep
+            else:
+                seg_starts.append(sp)
+                seg_ends.append(ep)
+        # Chains of phases: a chain starts with a phase which has records on its start date,
+        # and the other phases of the chain use the simulated values of the previous phases as initial values
+        chains = []
+        for (sp, ep) in zip(seg_starts, seg_ends):
+            start, next_date = dates[sp], dates[ep] + timedelta(days=1)
+            param_dict = dict(zip(parameters, param_arr[sp]))
+            if np.isnan(variable_arr[sp]).any() and chains:
+                chains[-1].append((start, next_date, None, param_dict))
+            else:
+                variable_df = variable_all_df.iloc[sp: dates.searchsorted(next_date, side="right")]
+                chains.append([(start, next_date, variable_df, param_dict)])
+        # Simulation (chains are independent)
+        solve_f = partial(self._solve_chain, tau=tau)
+        if n_jobs == 1 or len(chains) == 1:
+            results = [solve_f(chain) for chain in chains]
+        else:
+            with Pool(min(n_jobs, len(chains))) as p:
+                results = p.map(solve_f, chains)
+        dataframes = [df for result in results for df in result]
+        # Combine results of phases with a buffer of dates, values of the previous phases are used on the overlapped dates
+        days = pd.date_range(self._first, self._last, freq="D", name=self.DATE)
+        buffer = np.empty((len(days), len(dataframes[0].columns)), dtype=np.float64)
+        filled = np.zeros(len(days), dtype=np.bool_)
+        cursor = 0
+        for solved_df in dataframes:
+            head = days.searchsorted(solved_df.index[0])
+            values = solved_df.to_numpy(dtype=np.float64, na_value=np.nan)[max(cursor - head, 0): len(days) - head]
+            head = max(cursor, head)
+            buffer[head: head + len(values)] = values
+            filled[head: head + len(values)] = True
+            cursor = max(cursor, head + len(values))
+        df = pd.DataFrame(buffer[filled], index=days[filled], columns=dataframes[0].columns).astype(dataframes[0].dtypes)
         if model_specific:
-            return df.reset_index().convert_dtypes()
+            return df.reset_index()
         df = self._model.inverse_transform(data=df)
         df.index.name = self.DATE
-        return df.reset_index().convert_dtypes()
+        return df.reset_index()
+
+    def _solve_chain(self, chain, tau):
+        """Solve the ODE model with sequential phases.
+
+        Args:
+            chain (list[tuple(pandas.Timestamp, pandas.Timestamp, pandas.DataFrame or None, dict[str, float])]):
+                start date, the next date of end date, records (None for the phases except for the first phase) and ODE parameter values of phases
+            tau (int): tau value [min]
+
+        Returns:
+            list[pandas.DataFrame]: solutions of the phases, refer to covsirphy.ODEModel.solve()
+        """
+        dataframes = []
+        for (start, next_date, variable_df, param_dict) in chain:
+            if variable_df is None:
+                variable_df = pd.DataFrame(index=pd.date_range(start, next_date, freq="D"), columns=self._SIRF)
+                variable_df.update(self._model.inverse_transform(dataframes[-1]))
+            variable_df.index.name = self.DATE
+            instance = self._model.from_data(data=variable_df.reset_index(), param_dict=param_dict, tau=tau)
+            dataframes.append(instance.solve())
+        return dataframes
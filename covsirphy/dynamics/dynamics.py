@@ -1,6 +1,6 @@
 from __future__ import annotations
 from datetime import timedelta
-from functools import partial
+from functools import lru_cache, partial
 from multiprocessing import cpu_count, Pool
 import warnings
 import numpy as np
@@ -8,7 +8,7 @@ import pandas as pd
 from p_tqdm import p_umap
 from typing_extensions import Self
 from covsirphy.util.config import config
-from covsirphy.util.error import EmptyError, NotEnoughDataError, UnExpectedNoneError, UnExpectedValueRangeError
+from covsirphy.util.error import EmptyError, NotEnoughDataError, UnExpectedNoneError, UnExpectedValueError, UnExpectedValueRangeError
 from covsirphy.util.evaluator import Evaluator
 from covsirphy.util.stopwatch import StopWatch
 from covsirphy.util.validator import Validator
@@ -35,16 +35,59 @@ class Dynamics(Term):
         self._first = Validator(first_date, name="the first value of @date_range", accept_none=False).date()
         self._last = Validator(
             last_date, name="the second date of @date_range", accept_none=False).date(value_range=(self._first, None))
+        self._dates = self._date_array(self._first, self._last)
         self._tau = Validator(tau, "tau", accept_none=True).tau()
         self._name = None if name is None else Validator(name, "name").instance(str)
-        # Index: Date, Columns: S, I, F, R, ODE parameters
         self._parameters = self._model._PARAMETERS[:]
-        self._df = pd.DataFrame(
-            {self._PH: 0}, index=pd.date_range(start=self._first, end=self._last, freq="D"),
-            columns=[self._PH, *self._SIRF, *self._parameters])
+        self._day_parameters = self._model._DAY_PARAMETERS[:]
+        # Phase IDs, S/I/F/R and ODE parameter values as arrays of the dates
+        self._phase = np.zeros(len(self._dates), dtype=np.int64)
+        self._sirf = np.full((len(self._dates), len(self._SIRF)), np.nan)
+        self._params = np.full((len(self._dates), len(self._parameters)), np.nan)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _date_array(first: pd.Timestamp, last: pd.Timestamp) -> np.ndarray:
+        """Return the dates from the first date to the last date.
+
+        Args:
+            first: the first date
+            last: the last date
+
+        Returns:
+            read-only array of the dates from the first date to the last date
+
+        Note:
+            The results are cached because instances are frequently created with the same date range.
+        """
+        dates = pd.date_range(start=first, end=last, freq="D").values
+        dates.flags.writeable = False
+        return dates
 
     def __len__(self) -> int:
-        return self._df[self._PH].nunique()
+        return len(np.unique(self._phase))
+
+    @property
+    def _df(self) -> pd.DataFrame:
+        """Return the registered information as a dataframe.
+
+        Returns:
+            Index
+                Date (pandas.Timestamp): dates
+            Columns
+                Phase_ID (int): identification number of phases
+                Susceptible (int): the number of susceptible cases
+                Infected (int): the number of currently infected cases
+                Recovered (int): the number of recovered cases
+                Fatal (int): the number of fatal cases
+                (numpy.float64): ODE parameter values defined with model.PARAMETERS
+        """
+        df = pd.DataFrame(
+            {self._PH: self._phase, **dict(zip(self._SIRF, self._sirf.T)), **dict(zip(self._parameters, self._params.T))},
+            index=pd.DatetimeIndex(self._dates, freq="D", name=self.DATE))
+        sirf_dtypes = {
+            col: "Int64" if np.all(np.mod(arr[~np.isnan(arr)], 1) == 0) else "Float64" for (col, arr) in zip(self._SIRF, self._sirf.T)}
+        return df.astype({self._PH: "Int64", **sirf_dtypes, **dict.fromkeys(self._parameters, "Float64")})
 
     @property
     def model(self) -> ODEModel:
@@ -174,21 +217,29 @@ class Dynamics(Term):
         """
         if data is not None:
             new_df = Validator(data, "data").dataframe(time_index=True)
-            new_df.index = pd.to_datetime(new_df.index).round("D")
-            all_df = pd.DataFrame(np.nan, index=self._df.index, columns=self._df.columns)
-            all_df[self._PH] = 0
-            all_df.update(new_df, overwrite=True)
-            if all_df.loc[self._first, self._SIRF].isna().any():
+            dates = pd.to_datetime(new_df.index).tz_localize(None)
+            # Rounding is required only when some dates are not midnight-aligned
+            days = dates.to_numpy().astype("datetime64[D]").astype("datetime64[ns]")
+            new_df.index = pd.DatetimeIndex(days) if (days == dates.to_numpy()).all() else dates.round("D")
+            all_df = new_df.reindex(index=pd.DatetimeIndex(self._dates), columns=[*self._SIRF, *self._parameters])
+            sirf = all_df[self._SIRF].to_numpy(dtype=np.float64, na_value=np.nan)
+            params = all_df[self._parameters].to_numpy(dtype=np.float64, na_value=np.nan)
+            if np.isnan(sirf[0]).any():
                 raise EmptyError(
                     f"records on {self._first.strftime(self.DATE_FORMAT)}", details="Records must be registered for simulation")
-            if all_df.min().min() < 0:
-                raise UnExpectedValueRangeError("minimum value of the data", all_df.min().min(), (0, None))
-            all_df.index.name = self.DATE
-            self._df = all_df.convert_dtypes()
-            # Find change points with parameter values
-            param_df = all_df.loc[:, self._parameters].ffill().drop_duplicates().dropna(axis=0)
-            if not param_df.empty:
-                self._segment(points=param_df.index.tolist(), overwrite=True)
+            min_value = np.nanmin(np.hstack([sirf, params]))
+            if min_value < 0:
+                raise UnExpectedValueRangeError("minimum value of the data", min_value, (0, None))
+            self._phase = np.zeros(len(self._dates), dtype=np.int64)
+            self._sirf, self._params = sirf, params
+            # Find change points with parameter values (forward-filled) which differ from that of the previous dates
+            filled_idx = np.maximum.accumulate(np.where(np.isnan(params), 0, np.arange(len(params))[:, None]), axis=0)
+            filled = params[filled_idx, np.arange(params.shape[1])]
+            changed = np.ones(len(filled), dtype=np.bool_)
+            changed[1:] = np.any(filled[1:] != filled[:-1], axis=1)
+            change_idx = np.flatnonzero(changed & ~np.isnan(filled).any(axis=1))
+            if change_idx.size:
+                self._segment(points=pd.to_datetime(self._dates[change_idx]).tolist(), overwrite=True)
         return self._df.loc[:, [*self._SIRF, *self._parameters]]
 
     def _segment(self, points: list[str], overwrite: bool) -> None:
@@ -204,15 +255,15 @@ class Dynamics(Term):
         Note:
             @points must be selected from the first date to three days before the last date specified covsirphy.Dynamics(date_range).
         """
-        point_dates = [Validator(point, "a change point", accept_none=False).date() for point in points]
-        candidates = pd.date_range(start=self._first, end=self._last - timedelta(days=2), freq="D")
-        change_points = Validator(point_dates, "points", accept_none=False).sequence(unique=True, candidates=candidates)
-        df = self._df.copy()
-        if overwrite:
-            df[self._PH] = 0
-        for point in change_points:
-            df.loc[point:, self._PH] += 1
-        self._df = df.convert_dtypes()
+        point_dates = pd.DatetimeIndex(
+            [Validator(point, "a change point", accept_none=False).date().tz_localize(None) for point in points]).unique().values
+        candidates = self._dates[:max(len(self._dates) - 2, 0)]
+        for value in point_dates[~np.isin(point_dates, candidates)]:
+            raise UnExpectedValueError("points", pd.Timestamp(value), [str(candidate) for candidate in pd.DatetimeIndex(candidates)])
+        # Phase IDs are the number of change points on or before each date
+        positions = np.searchsorted(self._dates, point_dates, side="left")
+        phase_ids = np.cumsum(np.bincount(positions, minlength=len(self._dates) + 1)[:-1])
+        self._phase = phase_ids if overwrite else self._phase + phase_ids
 
     def segment(self, points: list[str] | None = None, overwrite: bool = False, **kwargs) -> Self:
         """Perform time-series segmentation with points manually selected or found with S-R trend analysis.
@@ -294,31 +345,53 @@ class Dynamics(Term):
                     (float): parameter values, including rho (if available)
                     (int or float): dimensional parameters, including 1/beta [days] (if tau and parameters are available)
         """
-        df = self._df.reset_index()
-        df[self._PH], _ = df[self._PH].factorize()
-        first_df = df.groupby(self._PH).first()
-        df = first_df.join(df.groupby(self._PH).last(), rsuffix="_last")
-        df = df.rename(columns={self.DATE: self.START, f"{self.DATE}_last": self.END})
-        df = df.loc[:, [col for col in df.columns if "_last" not in col]]
-        df.index = [self.num2str(num) for num in df.index]
+        # Phase IDs are monotonically non-decreasing, and boundaries of phases are where they change
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(self._phase)) + 1))
+        ends = np.concatenate((starts[1:] - 1, [len(self._phase) - 1]))
+        df = pd.DataFrame({self.START: self._dates[starts], self.END: self._dates[ends]})
+        df[self._parameters] = self._first_valid(self._params, starts=starts, ends=ends)
+        df.index = self._ordinals(len(df))
         df.index.name = self.PHASE  # type: ignore
         # Reproduction number
+        data = self._df.reset_index()
         df[self.RT] = df[self._parameters].apply(
-            lambda x: np.nan if x.isna().any() else self._model.from_data(data=self._df.reset_index(), param_dict=x.to_dict(), tau=self._tau).r0(), axis=1)
+            lambda x: np.nan if x.isna().any() else self._model.from_data(data=data, param_dict=x.to_dict(), tau=self._tau).r0(), axis=1)
         # Day parameters
         if self._tau is not None:
             days_df = df[self._parameters].apply(
                 lambda x: np.nan if x.isna().any() else self._model.from_data(
-                    data=self._df.reset_index(), param_dict=x.to_dict(), tau=self._tau).dimensional_parameters(),
+                    data=data, param_dict=x.to_dict(), tau=self._tau).dimensional_parameters(),
                 axis=1, result_type="expand"
             )
             df = pd.concat([df, days_df], axis=1)
         # Set the order of columns
         fixed_cols = [
-            self.START, self.END, self.RT, *self._model._PARAMETERS, *self._model._DAY_PARAMETERS]
+            self.START, self.END, self.RT, *self._parameters, *self._day_parameters]
         others = [col for col in df.columns if col not in set(fixed_cols) | set(self._SIRF)]
         return df.reindex(columns=[*fixed_cols, *others]).dropna(how="all", axis=1).ffill().convert_dtypes()
 
+    @staticmethod
+    def _first_valid(array: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """Return the first non-NA values of the segments for each column.
+
+        Args:
+            array: two-dimensional array of values which may include NA
+            starts: the first positions of the segments
+            ends: the last positions of the segments
+
+        Returns:
+            two-dimensional array with shape (the number of segments, the number of columns), NA when no values are available in the segments
+        """
+        result = np.full((len(starts), array.shape[1]), np.nan)
+        for i in range(array.shape[1]):
+            valid = np.flatnonzero(~np.isnan(array[:, i]))
+            if not valid.size:
+                continue
+            found = valid[np.minimum(np.searchsorted(valid, starts), valid.size - 1)]
+            hit = (found >= starts) & (found <= ends)
+            result[hit, i] = array[found[hit], i]
+        return result
+
     def track(self) -> pd.DataFrame:
         """Track reproduction number, parameter value and dimensional parameter values.
 
@@ -336,11 +409,12 @@ class Dynamics(Term):
             lambda x: pd.date_range(start=x[0], end=x[1], freq="D"), axis=1)
         return df.explode(self.DATE).set_index(self.DATE).drop([self.START, self.END], axis=1)
 
-    def simulate(self, model_specific: bool = False) -> pd.DataFrame:
+    def simulate(self, model_specific: bool = False, n_jobs: int | None = 1) -> pd.DataFrame:
         """Perform simulation with phase-dependent ODE model.
 
         Args:
             model_specific (bool): whether convert S, I, F, R to model-specific variables or not
+            n_jobs: the number of parallel jobs or None (CPU count)
 
         Raises:
             UnExpectedNoneError: tau value is un-set
@@ -357,12 +431,16 @@ class Dynamics(Term):
                     Recovered (int): the number of recovered cases
                     Fatal (int): the number of fatal cases
                     if @model_specific is True, variables defined by model.VARIABLES of covsirphy.Dynamics(model)
+
+        Note:
+            Phases which have records on their start dates are solved in parallel when @n_jobs is not 1.
         """
         if self._tau is None:
             raise UnExpectedNoneError(
                 "tau", details="Tau value must be set with covsirphy.Dynamics(tau) or covsirphy.Dynamics.tau or covsirphy.Dynamics.estimate_tau()")
+        n_jobs_validated = Validator(n_jobs, "n_jobs").int(value_range=(1, cpu_count()), default=cpu_count())
         simulator = _Simulator(model=self._model, data=self._df)
-        return simulator.run(tau=self._tau, model_specific=model_specific).set_index(self.DATE)
+        return simulator.run(tau=self._tau, model_specific=model_specific, n_jobs=n_jobs_validated).set_index(self.DATE)
 
     def estimate(self, **kwargs) -> Self:
         """Run covsirphy.Dynamics.estimate_tau() and covsirphy.Dynamics.estimate_params().
@@ -422,15 +500,14 @@ class Dynamics(Term):
         Returns:
             metric score
         """
-        parameters = self._model._PARAMETERS[:]
         all_df = self._df.dropna(how="any", subset=self._SIRF)
-        all_df[parameters] = all_df.loc[:, parameters].astype("Float64")
-        starts = all_df.reset_index().groupby(self._PH)[self.DATE].first().sort_values()
-        ends = all_df.reset_index().groupby(self._PH)[self.DATE].last().sort_values()
+        phase_df = all_df.reset_index()
+        starts = phase_df.drop_duplicates(self._PH, keep="first")[self.DATE]
+        ends = phase_df.drop_duplicates(self._PH, keep="last")[self.DATE]
         for start, end in zip(starts, ends):
             model_instance = self._model.from_data_with_quantile(
                 data=all_df.loc[start: end].reset_index(), tau=tau, q=q, digits=digits)
-            all_df.loc[start, parameters] = pd.Series(model_instance.settings()["param_dict"])
+            all_df.loc[start, self._parameters] = pd.Series(model_instance.settings()["param_dict"])
         simulator = _Simulator(model=self._model, data=all_df)
         sim_df = simulator.run(tau=tau, model_specific=False).set_index(self.DATE)
         evaluator = Evaluator(all_df[self._SIRF], sim_df[self._SIRF], how="inner")
@@ -465,8 +542,9 @@ class Dynamics(Term):
         if len(all_df) < 3:
             raise NotEnoughDataError("registered S/I/F/R data except NAs", all_df, 3)
         n_jobs_validated = Validator(n_jobs, "n_jobs").int(value_range=(1, cpu_count()), default=cpu_count())
-        starts = all_df.reset_index().groupby(self._PH)[self.DATE].first().sort_values()
-        ends = all_df.reset_index().groupby(self._PH)[self.DATE].last().sort_values()
+        phase_df = all_df.reset_index()
+        starts = phase_df.drop_duplicates(self._PH, keep="first")[self.DATE]
+        ends = phase_df.drop_duplicates(self._PH, keep="last")[self.DATE]
         est_f = partial(
             self._optimized_params, model=self._model, tau=self._tau, metric=metric, digits=digits, **kwargs)
         phase_dataframes = [all_df[start: end] for start, end in zip(starts, ends)]
@@ -537,11 +615,10 @@ class Dynamics(Term):
         """
         if phases is None:
             return self._first, self._last
-        all_df = self._df.copy()
-        all_df[self._PH], _ = all_df[self._PH].factorize()
-        phase_numbers = [all_df[self._PH].max() if ph == "last" else self.str2num(ph) for ph in phases]
-        df = all_df.loc[all_df[self._PH].isin(phase_numbers)]
-        return df.index.min(), df.index.max()
+        _, phase_ids = np.unique(self._phase, return_inverse=True)
+        phase_numbers = [phase_ids.max() if ph == "last" else self.str2num(ph) for ph in phases]
+        dates = pd.DatetimeIndex(self._dates[np.isin(phase_ids, phase_numbers)])
+        return dates.min(), dates.max()
 
     def parse_days(self, days: int, ref: pd.Timestamp | str | None = "last") -> tuple[pd.Timestamp, pd.Timestamp]:
         """Return min(ref, ref + days) and max(ref, ref + days).
@@ -595,5 +672,4 @@ class Dynamics(Term):
             start dates
         """
         df = self._df.reset_index()
-        df[self._PH], _ = df[self._PH].factorize()
-        return df.groupby(self._PH).first()[self.DATE].tolist()
+        return df.drop_duplicates(self._PH, keep="first")[self.DATE].tolist()
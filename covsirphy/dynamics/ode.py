@@ -163,14 +163,16 @@ class ODEModel(Term):
                     (pandas.Int64): model-specific dimensional variables of the model
         """
         step_n = math.ceil((self._end - self._start) / timedelta(minutes=self._tau))
+        # Evaluate only the first time-steps of dates because the solutions will be resampled with dates
+        t_eval = np.arange(0, step_n + 1, 1440 // self._tau)
         sol = solve_ivp(
             fun=self._discretize,
             t_span=[0, step_n],
             y0=np.array([self._initial_dict[variable] for variable in self._VARIABLES]),
-            t_eval=np.arange(0, step_n + 1, 1),
+            t_eval=t_eval,
             dense_output=False
         )
-        df = pd.DataFrame(data=sol["y"].T.copy(), columns=self._VARIABLES)
+        df = pd.DataFrame(data=sol["y"].T.copy(), index=t_eval, columns=self._VARIABLES)
         df = self._non_dim_to_date(data=df, tau=self._tau, start_date=self._start)
         return df.round().convert_dtypes()
 
@@ -228,7 +230,7 @@ class ODEModel(Term):
             raise UnExpectedNoneError("start_date", details="Not None value is required because tau is not None")
         Validator(tau, "tau", accept_none=False).tau()
         start = Validator(start_date, "start_date", accept_none=False).date()
-        df[cls.DATE] = (start + pd.Series(df.index * tau).apply(lambda x: timedelta(minutes=x))).tolist()
+        df[cls.DATE] = start + pd.to_timedelta(np.asarray(df.index, dtype=np.float64) * tau, unit="min")
         return df.set_index(cls.DATE).resample("D").first()
 
     @classmethod
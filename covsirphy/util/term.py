@@ -78,6 +78,8 @@ class Term(object):
     # Phase name
     SUFFIX_DICT = defaultdict(lambda: "th")
     SUFFIX_DICT.update({1: "st", 2: "nd", 3: "rd"})
+    # Phase names (0th, 1st, 2nd,...), extended with Term._ordinals()
+    _ORDINALS = []
     # Summary of phases
     TENSE = "Type"
     PAST = "Past"
@@ -112,6 +114,24 @@ class Term(object):
         suffix = "th" if q % 10 == 1 else cls.SUFFIX_DICT[mod]
         return f"{num}{suffix}"
 
+    @classmethod
+    def _ordinals(cls, n):
+        """
+        Return the first n phase names, 0th, 1st, 2nd,...
+
+        Args:
+            n (int): the number of names
+
+        Returns:
+            list[str]
+
+        Note:
+            The names are created with .num2str() in bulk (at least 1024 names) and cached.
+        """
+        if len(Term._ORDINALS) < n:
+            Term._ORDINALS = [cls.num2str(num) for num in range(max(n, 1024))]
+        return Term._ORDINALS[:n]
+
     @staticmethod
     def str2num(string, name="phase names"):
         """
@@ -10,9 +10,11 @@
 # add these directories to sys.path here. If the directory is relative to the
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 import os
+import runpy
 import sys
 sys.path.insert(0, os.path.abspath('../'))
-import covsirphy as cs  # noqa: E402
+# Read version without importing covsirphy and its dependencies
+__version__ = runpy.run_path(os.path.abspath('../covsirphy/__version__.py'))['__version__']
 
 
 # -- Project information -----------------------------------------------------
@@ -20,7 +22,7 @@ import covsirphy as cs  # noqa: E402
 project = 'CovsirPhy'
 copyright = '2020-2023, Hirokazu Takaya and CovsirPhy Development Team'
 author = 'Hirokazu Takaya and CovsirPhy Development Team'
-version = cs.__version__
+version = __version__
 
 # -- General configuration ---------------------------------------------------
 
@@ -2,7 +2,8 @@ import numpy as np
 import pandas as pd
 import pytest
 from covsirphy import Dynamics, SIRFModel, Term, Validator
-from covsirphy import EmptyError, NotEnoughDataError, NAFoundError, UnExpectedNoneError
+from covsirphy import EmptyError, NotEnoughDataError, NAFoundError, UnExpectedNoneError, UnExpectedTypeError, UnExpectedValueError
+from covsirphy.dynamics._simulator import _Simulator
 
 
 @pytest.fixture(scope="module", params=[SIRFModel])
@@ -17,6 +18,10 @@ def test_one_phase(model_class):
     assert dyn.name == "Dynamics"
     registered_df = dyn.register()
     Validator(registered_df).dataframe(columns=[*SIRFModel._VARIABLES, *SIRFModel._PARAMETERS])
+    assert registered_df[[Term.S, Term.CI, Term.R, Term.F]].dtypes.eq("Int64").all()
+    mixed_df = dyn.register(registered_df.assign(**{Term.S: registered_df[Term.S] + 0.5}))
+    assert mixed_df[Term.S].dtype == "Float64"
+    assert mixed_df[[Term.CI, Term.R, Term.F]].dtypes.eq("Int64").all()
     summary_df = dyn.summary()
     assert len(summary_df) == 1
     Validator(dyn.simulate()).dataframe(columns=[Term.S, Term.CI, Term.F, Term.R])
@@ -25,6 +30,15 @@ def test_one_phase(model_class):
     assert dyn.model_name == model_class._NAME
 
 
+def test_date_range(model_class):
+    with pytest.raises(UnExpectedTypeError):
+        Dynamics(model=model_class, date_range=(["x"], "31Jan2022"))
+    with pytest.raises(UnExpectedTypeError):
+        Dynamics(model=model_class, date_range=({"a": 1}, "31Jan2022"))
+    dyn = Dynamics(model=model_class, date_range=("01Jan2022", "31Jan2022"))
+    assert dyn.parse_phases() == tuple(pd.to_datetime(["01Jan2022", "31Jan2022"]))
+
+
 def test_two_phase(model_class):
     dyn = Dynamics.from_sample(model_class)
     registered_df = dyn.register()
@@ -39,6 +53,41 @@ def test_two_phase(model_class):
     Validator(dyn.simulate()).dataframe(columns=[Term.S, Term.CI, Term.F, Term.R])
 
 
+def test_register_change_points(model_class):
+    dyn = Dynamics.from_sample(model_class, date_range=("01Jan2022", "31Mar2022"))
+    registered_df = dyn.register()
+    rho = registered_df.loc[registered_df.index[0], "rho"]
+    registered_df.loc["01Feb2022", "rho"] = rho * 2
+    registered_df.loc["01Mar2022", "rho"] = rho
+    dyn.register(data=registered_df)
+    assert dyn.start_dates() == pd.to_datetime(["01Jan2022", "01Feb2022", "01Mar2022"]).tolist()
+
+
+def test_register_tz_aware(model_class):
+    dyn = Dynamics.from_sample(model_class, date_range=("01Jan2022", "31Mar2022"))
+    registered_df = dyn.register()
+    tz_df = registered_df.copy()
+    tz_df.index = tz_df.index.tz_localize("Asia/Tokyo")
+    tz_df.loc[tz_df.index[0], Term.CI] += 1
+    df = dyn.register(data=tz_df)
+    assert df.index[0] == pd.to_datetime("01Jan2022")
+    assert df.loc["01Jan2022", Term.CI] == registered_df.loc["01Jan2022", Term.CI] + 1
+
+
+def test_segment_tz_aware(model_class):
+    dyn = Dynamics.from_sample(model_class, date_range=("01Jan2022", "31Mar2022"))
+    dyn.segment(points=[pd.Timestamp("2022-02-01", tz="UTC"), "01Mar2022"])
+    assert dyn.start_dates() == pd.to_datetime(["01Jan2022", "01Feb2022", "01Mar2022"]).tolist()
+
+
+def test_segment_failed(model_class):
+    dyn = Dynamics.from_sample(model_class, date_range=("01Jan2022", "31Mar2022"))
+    dyn.segment(points=["01Feb2022"])
+    with pytest.raises(UnExpectedValueError):
+        dyn.segment(points=["01Mar2022", "31Mar2022"], overwrite=True)
+    assert dyn.start_dates() == pd.to_datetime(["01Jan2022", "01Feb2022"]).tolist()
+
+
 def test_from_data(model_class):
     sample_dyn = Dynamics.from_sample(model_class)
     dyn = Dynamics.from_data(model=model_class, data=sample_dyn.simulate())
@@ -46,6 +95,18 @@ def test_from_data(model_class):
     assert df.loc[df.index[0], model_class._PARAMETERS[0]] is pd.NA
 
 
+def test_simulate_parallel(model_class):
+    sample_dyn = Dynamics.from_sample(model_class, date_range=("01Jan2022", "31Mar2022"))
+    dyn = Dynamics.from_data(model=model_class, data=sample_dyn.simulate())
+    param_dict = sample_dyn.register().iloc[0][model_class._PARAMETERS].astype(float).to_dict()
+    dyn.register(data=dyn.register().assign(**param_dict))
+    dyn.segment(points=["01Feb2022", "01Mar2022"])
+    pd.testing.assert_frame_equal(dyn.simulate(n_jobs=None), dyn.simulate(n_jobs=1))
+    # Call _Simulator directly because n_jobs of Dynamics.simulate() is limited to the number of CPUs
+    simulator = _Simulator(model=model_class, data=dyn._df)
+    pd.testing.assert_frame_equal(simulator.run(tau=dyn.tau, n_jobs=2).set_index(Term.DATE), dyn.simulate(n_jobs=1))
+
+
 def test_simulate_failed(model_class):
     dyn = Dynamics.from_sample(model_class)
     df = dyn.register()
@@ -95,6 +156,7 @@ def test_parse(model_class):
     dyn = Dynamics.from_sample(model=model_class, date_range=("01Jan2022", "31Mar2022"))
     dyn.segment(points=["01Feb2022", "01Mar2022"])
     assert len(dyn) == 3
+    assert dyn.summary().index.tolist() == ["0th", "1st", "2nd"]
     assert dyn.parse_phases(phases=None) == tuple(pd.to_datetime(["01Jan2022", "31Mar2022"]))
     assert dyn.parse_phases(phases=["1st", "last"]) == tuple(pd.to_datetime(["01Feb2022", "31Mar2022"]))
     assert dyn.parse_days(days=-10, ref="last") == tuple(pd.to_datetime(["21Mar2022", "31Mar2022"]))
@@ -4,8 +4,15 @@ from covsirphy import Term
 from covsirphy.gis._subset import _SubsetManager as SubsetManager
 
 
-def test_layer():
-    day0, day1 = pd.to_datetime("2022-01-01"), pd.to_datetime("2022-01-02")
+day0, day1 = pd.to_datetime("2022-01-01"), pd.to_datetime("2022-01-02")
+
+
+@pytest.fixture(scope="module")
+def geography():
+    return SubsetManager(layers=[Term.COUNTRY, Term.PROVINCE, Term.CITY])
+
+
+def test_layer(geography):
     raw = pd.DataFrame(
         {
             Term.COUNTRY: [Term.NA, Term.NA, *["UK" for _ in range(4)], *["Japan" for _ in range(10)]],
@@ -18,7 +25,6 @@ def test_layer():
             Term.C: range(16),
         }
     )
-    geography = SubsetManager(layers=[Term.COUNTRY, Term.PROVINCE, Term.CITY])
     # When `geo=None` or `geo=(None,)`, returns country-level data.
     df = pd.DataFrame(
         {
@@ -85,8 +91,7 @@ def test_layer():
         geography.layer(data=raw, geo=("The Earth", "Japan", "Tokyo", "Chiyoda"))
 
 
-def test_filter():
-    day0, day1 = pd.to_datetime("2022-01-01"), pd.to_datetime("2022-01-02")
+def test_filter(geography):
     raw = pd.DataFrame(
         {
             Term.COUNTRY: [*["UK" for _ in range(4)], *["Japan" for _ in range(10)], Term.NA, Term.NA],
@@ -99,7 +104,6 @@ def test_filter():
             Term.C: range(16),
         }
     )
-    geography = SubsetManager(layers=[Term.COUNTRY, Term.PROVINCE, Term.CITY])
     # When `geo = None` or `geo = (None,)`, returns all country-level data.
     df = pd.DataFrame(
         {